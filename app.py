@@ -51,8 +51,6 @@ def main():
     cursor.execute('SELECT * FROM articles')
     articles = cursor.fetchall()
 
-    conn.close()
-
     # Display results
     print("\nMagazines:")
     for magazine in magazines:
@@ -1,8 +1,41 @@
+import atexit
 import sqlite3
+import threading
+from collections import OrderedDict
 
 DATABASE_NAME = './database/magazine.db'
 
+# One connection per thread, opened lazily and reused by every model call
+_local = threading.local()
+
 def get_db_connection():
-    conn = sqlite3.connect(DATABASE_NAME)
-    conn.row_factory = sqlite3.Row
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(DATABASE_NAME, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # page_size only takes effect on a new, empty file and must be set before WAL
+        conn.execute('PRAGMA page_size = 8192')
+        conn.execute('PRAGMA journal_mode = WAL')
+        conn.execute('PRAGMA synchronous = NORMAL')
+        conn.execute('PRAGMA temp_store = MEMORY')
+        conn.execute('PRAGMA cache_size = -64000')
+        conn.execute('PRAGMA mmap_size = 268435456')
+        conn.execute('PRAGMA foreign_keys = ON')  # ON DELETE CASCADE is a no-op without this
+        _local.conn = conn
+        _local.cursors = OrderedDict()
     return conn
+
+def get_thread_cursors():
+    """ Return the current thread's SQL -> cursor LRU; it lives and dies with the connection. """
+    get_db_connection()
+    return _local.cursors
+
+def close_db_connection():
+    """ Close the current thread's cached connection, if one is open. """
+    conn = getattr(_local, 'conn', None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+        _local.cursors = OrderedDict()
+
+atexit.register(close_db_connection)
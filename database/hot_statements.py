@@ -0,0 +1,16 @@
+from .statements import exec_cached
+
+# The by-id lookups every model load goes through
+HOT_SQL = {
+    'author_by_id': 'SELECT name FROM authors WHERE id = ?',
+    'magazine_by_id': 'SELECT name, category FROM magazines WHERE id = ?',
+    'article_by_id': """
+        SELECT id, title, content, author_id, magazine_id
+        FROM articles
+        WHERE id = ?
+    """,
+}
+
+def exec_hot(name, params):
+    """ Execute the hot query 'name' through the shared cursor cache. Returns the cursor. """
+    return exec_cached(HOT_SQL[name], params)
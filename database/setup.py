@@ -1,29 +1,51 @@
+import logging
+import sqlite3
+
 from .connection import get_db_connection
+from models.author import Author
+from models.magazine import Magazine
+
+logger = logging.getLogger(__name__)
 
 def create_tables():
-    try:
-        conn = get_db_connection()
+    conn = get_db_connection()
+
+    # Refuse rather than fold the caller's pending writes into the rebuild, or roll them
+    # back with it if it fails
+    if conn.in_transaction:
+        raise sqlite3.OperationalError(
+            "create_tables() cannot run while the connection has an open transaction; "
+            "commit or roll back first."
+        )
+
+    # The connection is shared, so it is not closed here. Used as a context manager it
+    # commits on success and rolls back on error, letting the exception propagate.
+    with conn:
         cursor = conn.cursor()
 
-        # Drop the old tables if they exist
-        print("Dropping existing tables...")
+        # Rebuild the whole schema in one transaction so it costs a single commit
+        cursor.execute('BEGIN')
+
+        # Drop the old tables if they exist. articles goes first because it holds
+        # the foreign keys to magazines and authors.
+        logger.debug("Dropping existing tables...")
         cursor.execute('DROP TABLE IF EXISTS articles')
         cursor.execute('DROP TABLE IF EXISTS magazines')
         cursor.execute('DROP TABLE IF EXISTS authors')
 
         # Create Authors Table
-        print("Creating authors table...")
+        logger.debug("Creating authors table...")
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS authors (
+            CREATE TABLE authors (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 name TEXT NOT NULL UNIQUE -- Author name must be unique
             )
         ''')
 
         # Create Magazines Table
-        print("Creating magazines table...")
+        logger.debug("Creating magazines table...")
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS magazines (
+            CREATE TABLE magazines (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 name TEXT NOT NULL UNIQUE, -- Magazine name must be unique
                 category TEXT NOT NULL CHECK(LENGTH(category) > 0) -- Category cannot be empty
@@ -31,9 +53,9 @@ def create_tables():
         ''')
 
         # Create Articles Table
-        print("Creating articles table...")
+        logger.debug("Creating articles table...")
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS articles (
+            CREATE TABLE articles (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 title TEXT NOT NULL CHECK(LENGTH(title) BETWEEN 5 AND 50), -- Title length constraint
                 content TEXT NOT NULL, -- Content is mandatory for articles
@@ -44,11 +66,14 @@ def create_tables():
             )
         ''')
 
-        conn.commit()  # Commit changes
-        print("Tables recreated successfully.")
+        # Index the foreign keys that every relationship query filters on. Each composite
+        # index leads with one key and covers the other, so the magazine/contributor lookups
+        # are index-only; they also serve lookups on their leading column alone.
+        logger.debug("Creating article indexes...")
+        cursor.execute('CREATE INDEX idx_articles_author_magazine ON articles (author_id, magazine_id)')
+        cursor.execute('CREATE INDEX idx_articles_magazine_author ON articles (magazine_id, author_id)')
 
-    except Exception as e:
-        print(f"Error creating tables: {e}")
-    
-    finally:
-        conn.close()  # Ensure the connection is closed
\ No newline at end of file
+    # Cached objects refer to rows that no longer exist
+    Author._cache.clear()
+    Magazine._cache.clear()
+    logger.debug("Tables recreated successfully.")
@@ -0,0 +1,45 @@
+from .connection import get_db_connection, get_thread_cursors
+
+# Cursors kept per thread; the least recently used one is dropped past this
+CURSOR_CACHE_SIZE = 64
+
+def _cursor_for(sql):
+    """ Return the current thread's cursor reserved for 'sql', creating it on first use. """
+    cursors = get_thread_cursors()
+    cursor = cursors.get(sql)
+    if cursor is None:
+        cursor = cursors[sql] = get_db_connection().cursor()
+        if len(cursors) > CURSOR_CACHE_SIZE:
+            cursors.popitem(last=False)
+    else:
+        cursors.move_to_end(sql)
+    return cursor
+
+def exec_cached(sql, params=()):
+    """
+    Execute 'sql' on the shared connection through a cursor reused for that SQL string.
+    sqlite3 keeps the compiled statement in the connection's own statement cache; reusing
+    the cursor saves allocating a new one per call. Returns the cursor.
+    """
+    return _cursor_for(sql).execute(sql, params)
+
+def exec_many_cached(sql, seq_of_params):
+    """
+    Execute 'sql' once per parameter tuple through the same cached cursor exec_cached
+    uses. Returns the cursor.
+    """
+    return _cursor_for(sql).executemany(sql, seq_of_params)
+
+def exec_streaming(sql, params=()):
+    """
+    Execute 'sql' on a fresh cursor of the shared connection, for results that are
+    consumed lazily. A cached cursor would be reset if the same query ran again before
+    the caller finished iterating; sqlite3's per-connection statement cache still saves
+    the re-parse. Returns the cursor.
+
+    Until the cursor is exhausted or closed, the statement holds a read snapshot open on
+    this thread's connection. While it does, schema changes fail with "database table is
+    locked", and once another connection commits, every write on this thread fails with
+    "database is locked". Iterate results to the end or close them before writing.
+    """
+    return get_db_connection().cursor().execute(sql, params)
@@ -1,9 +1,66 @@
 
 from database.connection import get_db_connection
+from database.hot_statements import exec_hot
+from database.statements import exec_cached, exec_many_cached
 from models.author import Author
 from models.magazine import Magazine
 
+SQL_INSERT_ARTICLE = """
+    INSERT INTO articles (title, content, author_id, magazine_id)
+    VALUES (?, ?, ?, ?)
+"""
+SQL_UPDATE_ARTICLE_CONTENT = """
+    UPDATE articles
+    SET content = ?
+    WHERE id = ?
+"""
+
+_STR = str
+
+def _strip(value):
+    """ Strip a str once; anything else is passed through for validation to reject. """
+    return value.strip() if value.__class__ is _STR else value
+
+def _valid_title(title):
+    """ A title is a str of 5-50 characters. """
+    return title.__class__ is _STR and 4 < len(title) < 51
+
+def _valid_content(content):
+    """ Content is a str that is not empty once stripped. """
+    return content.__class__ is _STR and content != ''
+
+def _valid_id(value):
+    """ An ID is a positive int; bool is rejected even though it subclasses int. """
+    return type(value) is int and value > 0
+
+def _valid_article_row(row):
+    """ Return True if a (title, content, author_id, magazine_id) row passes every check. """
+    title, content, author_id, magazine_id = row
+    return (_valid_title(title) and _valid_content(content)
+            and _valid_id(author_id) and _valid_id(magazine_id))
+
+def _validate_article_fields(title, content, author_id, magazine_id):
+    """ Raise ValueError if any of the article's fields is invalid. """
+    if not _valid_title(title):
+        raise ValueError("Title must be a string between 5-50 characters.")
+    if not _valid_content(content):
+        raise ValueError("Content must be a non-empty string.")
+    if not _valid_id(author_id):
+        raise ValueError("Author ID must be a positive integer.")
+    if not _valid_id(magazine_id):
+        raise ValueError("Magazine ID must be a positive integer.")
+
+def _existing_ids(cursor, table, ids):
+    """ Return the subset of 'ids' that are present in 'table'. """
+    if not ids:
+        return set()
+    placeholders = ', '.join('?' * len(ids))
+    cursor.execute(f'SELECT id FROM {table} WHERE id IN ({placeholders})', tuple(ids))
+    return {id_ for (id_,) in cursor}
+
 class Article:
+    __slots__ = ('_id', '_title', '_content', '_author_id', '_magazine_id', '_author_obj', '_magazine_obj')
+
     def __init__(self, id=None, title=None, content=None, author_id=None, magazine_id=None):
         """
         Initialize a new Article object or fetch an existing one from the database.
@@ -13,6 +70,8 @@ class Article:
         self._content = None
         self._author_id = None
         self._magazine_id = None
+        self._author_obj = None
+        self._magazine_obj = None
 
         if id is not None:
             self.load_by_id(id)
@@ -21,11 +80,10 @@ class Article:
 
     def load_by_id(self, article_id):
         """ Fetch an existing article by its ID from the database. """
-        result = self.fetch_data("""
-            SELECT id, title, content, author_id, magazine_id
-            FROM articles
-            WHERE id = ?
-        """, (article_id,))
+        if not _valid_id(article_id):
+            raise ValueError('ID must be a positive integer.')
+
+        result = exec_hot('article_by_id', (article_id,)).fetchone()
         
         if result:
             self._id, self._title, self._content, self._author_id, self._magazine_id = result
@@ -34,48 +92,73 @@ class Article:
 
     def create(self, title, content, author_id, magazine_id):
         """ Create a new article in the database. """
-        if not (isinstance(title, str) and 5 <= len(title) <= 50):
-            raise ValueError("Title must be a string between 5-50 characters.")
-        if not (isinstance(content, str) and len(content.strip()) > 0):
-            raise ValueError("Content must be a non-empty string.")
-        if not (isinstance(author_id, int) and author_id > 0):
-            raise ValueError("Author ID must be a positive integer.")
-        if not (isinstance(magazine_id, int) and magazine_id > 0):
-            raise ValueError("Magazine ID must be a positive integer.")
-        
+        title, content = _strip(title), _strip(content)
+        _validate_article_fields(title, content, author_id, magazine_id)
+
         # Verify that the author and magazine exist
-        try:
-            author = Author.get(author_id)
-        except ValueError:
+        if not Author.exists(author_id):
             raise ValueError(f"Author with id {author_id} does not exist.")
-        
-        try:
-            magazine = Magazine.get(magazine_id)
-        except ValueError:
+        if not Magazine.exists(magazine_id):
             raise ValueError(f"Magazine with id {magazine_id} does not exist.")
         
         # Insert the article into the database
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO articles (title, content, author_id, magazine_id)
-                VALUES (?, ?, ?, ?)
-            """, (title.strip(), content.strip(), author_id, magazine_id))
-            conn.commit()
+        cursor = exec_cached(SQL_INSERT_ARTICLE, (title, content, author_id, magazine_id))
+        get_db_connection().commit()
+
+        # Set attributes after successful insertion
+        self._id = cursor.lastrowid
+        self._title = title
+        self._content = content
+        self._author_id = author_id
+        self._magazine_id = magazine_id
+
+    @classmethod
+    def bulk_create(cls, rows):
+        """
+        Insert many (title, content, author_id, magazine_id) rows in a single transaction.
+        Every row is validated before anything is written, and the referenced authors and
+        magazines are checked with one query each. Returns the range of the new article IDs.
+        """
+        params = [(_strip(title), _strip(content), author_id, magazine_id)
+                  for title, content, author_id, magazine_id in rows]
+        invalid = [row for row in params if not _valid_article_row(row)]
+        if invalid:
+            _validate_article_fields(*invalid[0])
+        if not params:
+            return range(0)
+
+        conn = get_db_connection()
+        cursor = conn.cursor()
 
-            # Set attributes after successful insertion
-            self._id = cursor.lastrowid
-            self._title = title.strip()
-            self._content = content.strip()
-            self._author_id = author_id
-            self._magazine_id = magazine_id
+        # Verify that every referenced author and magazine exists
+        valid_authors = _existing_ids(cursor, 'authors', {author_id for _, _, author_id, _ in params})
+        valid_magazines = _existing_ids(cursor, 'magazines', {magazine_id for _, _, _, magazine_id in params})
+        for _, _, author_id, magazine_id in params:
+            if author_id not in valid_authors:
+                raise ValueError(f"Author with id {author_id} does not exist.")
+            if magazine_id not in valid_magazines:
+                raise ValueError(f"Magazine with id {magazine_id} does not exist.")
 
-    def fetch_data(self, query, params):
-        """ Helper method to fetch data from the database. """
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            return cursor.fetchone()
+        # Started outside the try: if the caller already has a transaction open this raises,
+        # and their pending writes must not be rolled back with ours
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            exec_many_cached(SQL_INSERT_ARTICLE, params)
+            last_id = cursor.execute('SELECT last_insert_rowid()').fetchone()[0]
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return range(last_id - len(params) + 1, last_id + 1)
+
+    @staticmethod
+    def fetch_data(query, params):
+        """ Helper method to fetch one row for an arbitrary query from the database. """
+        cursor = get_db_connection().cursor()
+        try:
+            return cursor.execute(query, params).fetchone()
+        finally:
+            cursor.close()  # Multi-row queries would otherwise leave the statement pending
 
     @property
     def id(self):
@@ -95,28 +178,27 @@ class Article:
     @content.setter
     def content(self, new_content):
         """Update the article's content in the database."""
-        if not (isinstance(new_content, str) and len(new_content.strip()) > 0):
+        new_content = _strip(new_content)
+        if not _valid_content(new_content):
             raise ValueError("Content must be a non-empty string.")
         
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                UPDATE articles
-                SET content = ?
-                WHERE id = ?
-            """, (new_content.strip(), self._id))
-            conn.commit()
-            self._content = new_content.strip()
+        exec_cached(SQL_UPDATE_ARTICLE_CONTENT, (new_content, self._id))
+        get_db_connection().commit()
+        self._content = new_content
 
     @property
     def author(self):
         """Return the Author object associated with this article."""
-        return Author.get(self._author_id)
+        if self._author_obj is None:
+            self._author_obj = Author.get(self._author_id)
+        return self._author_obj
 
     @property
     def magazine(self):
         """Return the Magazine object associated with this article."""
-        return Magazine.get(self._magazine_id)
+        if self._magazine_obj is None:
+            self._magazine_obj = Magazine.get(self._magazine_id)
+        return self._magazine_obj
 
     def __repr__(self):
         """Return a string representation of the Article."""
@@ -1,9 +1,46 @@
 
 
 from database.connection import get_db_connection
+from database.hot_statements import exec_hot
+from database.statements import exec_cached, exec_streaming
 from models.magazine import Magazine
 
+SQL_AUTHOR_EXISTS = 'SELECT 1 FROM authors WHERE id = ?'
+SQL_GET_AUTHOR_BY_ID = 'SELECT id, name FROM authors WHERE id = ?'
+SQL_GET_AUTHOR_ID_BY_NAME = 'SELECT id FROM authors WHERE name = ?'
+SQL_INSERT_AUTHOR = 'INSERT INTO authors (name) VALUES (?)'
+SQL_UPDATE_AUTHOR_NAME = 'UPDATE authors SET name = ? WHERE id = ?'
+SQL_GET_AUTHOR_ARTICLES = """
+    SELECT articles.title, articles.content, articles.author_id, articles.magazine_id
+    FROM articles
+    WHERE articles.author_id = ?
+"""
+SQL_GET_AUTHOR_MAGAZINES = """
+    SELECT id, name, category
+    FROM magazines
+    WHERE id IN (SELECT magazine_id FROM articles WHERE author_id = ?)
+"""
+
+_STR = str
+
+def _strip(value):
+    """ Strip a str once; anything else is passed through for validation to reject. """
+    return value.strip() if value.__class__ is _STR else value
+
+def _valid_id(value):
+    """ An ID is a positive int; bool is rejected even though it subclasses int. """
+    return type(value) is int and value > 0
+
+def _valid_name(name):
+    """ A name is a str that is not empty once stripped. """
+    return name.__class__ is _STR and name != ''
+
 class Author:
+    __slots__ = ('_id', '_name')
+
+    # Authors already handed out by get(), keyed by ID
+    _cache = {}
+
     def __init__(self, id=None, name=None):
         """
         Initialize a new Author object. Either 'id' or 'name' must be provided.
@@ -22,62 +59,58 @@ class Author:
 
     def load_by_id(self, author_id):
         """ Load author data from the database using their ID. """
-        if not isinstance(author_id, int) or author_id <= 0:
+        if not _valid_id(author_id):
             raise ValueError('ID must be a positive integer.')
 
-        result = self.fetch_data('SELECT name FROM authors WHERE id = ?', (author_id,))
+        result = exec_hot('author_by_id', (author_id,)).fetchone()
         if result:
-            self._id, self._name = author_id, result[0]
+            (self._name,) = result
+            self._id = author_id
         else:
             raise ValueError(f"Author with id {author_id} not found in the database.")
 
     def create(self, name):
         """ Insert a new author into the database. """
-        if not isinstance(name, str) or len(name.strip()) == 0:
+        name = _strip(name)
+        if not _valid_name(name):
             raise ValueError("Name must be a non-empty string.")
         
-        result = self.fetch_data('SELECT id FROM authors WHERE name = ?', (name.strip(),))
+        result = exec_cached(SQL_GET_AUTHOR_ID_BY_NAME, (name,)).fetchone()
         if result:
-            self._id = result[0]  # Existing author found, use its ID
-            self._name = name.strip()
+            (self._id,) = result  # Existing author found, use its ID
+            self._name = name
         else:
             # Insert new author
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('INSERT INTO authors (name) VALUES (?)', (name.strip(),))
-                conn.commit()
-                self._id = cursor.lastrowid
-                self._name = name.strip()
-
-    def fetch_data(self, query, params):
-        """ Helper method to fetch data from the database. """
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            return cursor.fetchone()
+            cursor = exec_cached(SQL_INSERT_AUTHOR, (name,))
+            get_db_connection().commit()
+            self._id = cursor.lastrowid
+            self._name = name
+
+    @staticmethod
+    def fetch_data(query, params):
+        """ Helper method to fetch one row for an arbitrary query from the database. """
+        cursor = get_db_connection().cursor()
+        try:
+            return cursor.execute(query, params).fetchone()
+        finally:
+            cursor.close()  # Multi-row queries would otherwise leave the statement pending
 
     @property
     def name(self):
-        """ Return the author's name. If it's not already loaded, fetch it from the database. """
-        if not self._name:
-            result = self.fetch_data('SELECT name FROM authors WHERE id = ?', (self._id,))
-            if result:
-                self._name = result[0]
-            else:
-                raise ValueError("Author not found in the database.")
+        """ Return the author's name. """
         return self._name
     
     @name.setter
     def name(self, new_name):
         """ Update the author's name in the database, if it's valid. """
-        if not isinstance(new_name, str) or len(new_name.strip()) == 0:
+        new_name = _strip(new_name)
+        if not _valid_name(new_name):
             raise ValueError("Name must be a non-empty string.")
         
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('UPDATE authors SET name = ? WHERE id = ?', (new_name.strip(), self._id))
-            conn.commit()
-            self._name = new_name.strip()
+        exec_cached(SQL_UPDATE_AUTHOR_NAME, (new_name, self._id))
+        get_db_connection().commit()
+        self._name = new_name
+        type(self)._cache.pop(self._id, None)
 
     @property
     def id(self):
@@ -87,53 +120,56 @@ class Author:
     @id.setter
     def id(self, new_id):
         """ Update the author's ID, ensuring it is a valid positive integer. """
-        if not isinstance(new_id, int) or new_id <= 0:
+        if not _valid_id(new_id):
             raise ValueError('ID must be a positive integer.')
+        type(self)._cache.pop(self._id, None)
         self._id = new_id
 
+    @classmethod
+    def _from_row(cls, row):
+        """ Build an Author from an (id, name) row without querying the database again. """
+        author = cls.__new__(cls)
+        author._id, author._name = row
+        return author
+
+    @classmethod
+    def exists(cls, author_id):
+        """ Return True if an author with this ID is in the database. """
+        return exec_cached(SQL_AUTHOR_EXISTS, (author_id,)).fetchone() is not None
+
     @classmethod
     def get(cls, author_id):
         """ Retrieve an Author by their ID. """
-        if not isinstance(author_id, int) or author_id <= 0:
+        if not _valid_id(author_id):
             raise ValueError('ID must be a positive integer.')
         
-        result = cls.fetch_data('SELECT id, name FROM authors WHERE id = ?', (author_id,))
+        author = cls._cache.get(author_id)
+        if author is not None:
+            return author
+
+        result = exec_cached(SQL_GET_AUTHOR_BY_ID, (author_id,)).fetchone()
         if result:
-            return cls(id=result[0], name=result[1])  # Return Author object
+            author = cls._cache[author_id] = cls._from_row(result)
+            return author
         else:
             raise ValueError(f"Author with id {author_id} not found.")
     
     def articles(self):
-        """ Retrieve all articles written by this author. """
+        """ Yield the rows of every article written by this author. """
+        cursor = exec_streaming(SQL_GET_AUTHOR_ARTICLES, (self._id,))
         try:
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT articles.title, articles.content, articles.author_id, articles.magazine_id
-                    FROM articles 
-                    WHERE articles.author_id = ?               
-                """, (self._id,))
-                return cursor.fetchall()
-        except Exception as e:
-            print(f"Error fetching articles for author {self._id}: {e}")
-            return []
+            yield from cursor
+        finally:
+            cursor.close()
 
     def magazines(self):
-        """ Retrieve all magazines where this author has articles. """
+        """ Yield every magazine where this author has articles. """
+        cursor = exec_streaming(SQL_GET_AUTHOR_MAGAZINES, (self._id,))
         try:
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT DISTINCT magazines.id, magazines.name, magazines.category
-                    FROM magazines
-                    INNER JOIN articles ON articles.magazine_id = magazines.id
-                    WHERE articles.author_id = ?
-                """, (self._id,))
-                results = cursor.fetchall()
-                return [Magazine(id=result[0], name=result[1], category=result[2]) for result in results]
-        except Exception as e:
-            print(f"Error fetching magazines for author {self._id}: {e}")
-            return []
+            for row in cursor:
+                yield Magazine._from_row(row)
+        finally:
+            cursor.close()
 
     def __repr__(self):
         """ String representation of the Author. """
@@ -1,6 +1,44 @@
 from database.connection import get_db_connection
+from database.hot_statements import exec_hot
+from database.statements import exec_cached, exec_streaming
+
+SQL_MAGAZINE_EXISTS = 'SELECT 1 FROM magazines WHERE id = ?'
+SQL_GET_MAGAZINE_BY_ID = 'SELECT id, name, category FROM magazines WHERE id = ?'
+SQL_GET_MAGAZINE_ID_BY_NAME = 'SELECT id FROM magazines WHERE name = ? AND category = ?'
+SQL_INSERT_MAGAZINE = 'INSERT INTO magazines (name, category) VALUES (?, ?)'
+SQL_UPDATE_MAGAZINE_NAME = 'UPDATE magazines SET name = ? WHERE id = ?'
+SQL_UPDATE_MAGAZINE_CATEGORY = 'UPDATE magazines SET category = ? WHERE id = ?'
+SQL_GET_MAGAZINE_ARTICLES = """
+    SELECT articles.title, articles.content, articles.author_id
+    FROM articles
+    WHERE articles.magazine_id = ?
+"""
+SQL_GET_MAGAZINE_CONTRIBUTORS = """
+    SELECT id, name
+    FROM authors
+    WHERE id IN (SELECT author_id FROM articles WHERE magazine_id = ?)
+"""
+
+_STR = str
+
+def _valid_id(value):
+    """ An ID is a positive int; bool is rejected even though it subclasses int. """
+    return type(value) is int and value > 0
+
+def _valid_name(name):
+    """ A name is a str of 2-16 characters. """
+    return name.__class__ is _STR and 1 < len(name) < 17
+
+def _valid_category(category):
+    """ A category is a non-empty str. """
+    return category.__class__ is _STR and category != ''
 
 class Magazine:
+    __slots__ = ('_id', '_name', '_category')
+
+    # Magazines already handed out by get(), keyed by ID
+    _cache = {}
+
     def __init__(self, id=None, name=None, category=None):
         """
         Initialize a new Magazine object.
@@ -21,118 +59,114 @@ class Magazine:
         
     def load_by_id(self, magazine_id):
         """ Load magazine data from the database using its ID. """
-        if not isinstance(magazine_id, int) or magazine_id <= 0:
+        if not _valid_id(magazine_id):
             raise ValueError('ID must be a positive integer.')
         
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT name, category FROM magazines WHERE id = ?', (magazine_id,))
-            result = cursor.fetchone()
-            if result:
-                self._id, self._name, self._category = magazine_id, result[0], result[1]
-            else:
-                raise ValueError(f"Magazine with id {magazine_id} not found in the database.")
+        result = exec_hot('magazine_by_id', (magazine_id,)).fetchone()
+        if result:
+            self._name, self._category = result
+            self._id = magazine_id
+        else:
+            raise ValueError(f"Magazine with id {magazine_id} not found in the database.")
     
     def create(self, name, category):
         """ Insert a new magazine into the database. """
-        if not isinstance(name, str) or not (2 <= len(name) <= 16):
+        if not _valid_name(name):
             raise ValueError("Name must be a string between 2-16 characters.")
-        if not isinstance(category, str) or len(category) == 0:
+        if not _valid_category(category):
             raise ValueError("Category must be a non-empty string.")
         
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT id FROM magazines WHERE name = ? AND category = ?', (name, category))
-            result = cursor.fetchone()
-            if result:
-                self._id = result[0]  # Existing magazine found, use its ID
-                self._name = name
-                self._category = category
-            else:
-                # Insert new magazine
-                cursor.execute('INSERT INTO magazines (name, category) VALUES (?, ?)', (name, category))
-                conn.commit()
-                self._id = cursor.lastrowid
-                self._name = name
-                self._category = category
+        result = exec_cached(SQL_GET_MAGAZINE_ID_BY_NAME, (name, category)).fetchone()
+        if result:
+            (self._id,) = result  # Existing magazine found, use its ID
+            self._name = name
+            self._category = category
+        else:
+            # Insert new magazine
+            cursor = exec_cached(SQL_INSERT_MAGAZINE, (name, category))
+            get_db_connection().commit()
+            self._id = cursor.lastrowid
+            self._name = name
+            self._category = category
 
     @property
     def name(self):
-        """ Return the magazine's name from the database if not already loaded. """
-        if not self._name:
-            self.load_by_id(self._id)
+        """ Return the magazine's name. """
         return self._name
     
     @name.setter
     def name(self, new_name):
         """ Update the magazine's name in the database. """
-        if not isinstance(new_name, str) or not (2 <= len(new_name) <= 16):
+        if not _valid_name(new_name):
             raise ValueError("Name must be a string between 2-16 characters.")
         
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('UPDATE magazines SET name = ? WHERE id = ?', (new_name, self._id))
-            conn.commit()
-            self._name = new_name
+        exec_cached(SQL_UPDATE_MAGAZINE_NAME, (new_name, self._id))
+        get_db_connection().commit()
+        self._name = new_name
+        type(self)._cache.pop(self._id, None)
 
     @property
     def category(self):
-        """ Return the magazine's category from the database if not already loaded. """
-        if not self._category:
-            self.load_by_id(self._id)
+        """ Return the magazine's category. """
         return self._category
     
     @category.setter
     def category(self, new_category):
         """ Update the magazine's category in the database. """
-        if not isinstance(new_category, str) or len(new_category) == 0:
+        if not _valid_category(new_category):
             raise ValueError("Category must be a non-empty string.")
         
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('UPDATE magazines SET category = ? WHERE id = ?', (new_category, self._id))
-            conn.commit()
-            self._category = new_category
+        exec_cached(SQL_UPDATE_MAGAZINE_CATEGORY, (new_category, self._id))
+        get_db_connection().commit()
+        self._category = new_category
+        type(self)._cache.pop(self._id, None)
+
+    @classmethod
+    def _from_row(cls, row):
+        """ Build a Magazine from an (id, name, category) row without querying the database again. """
+        magazine = cls.__new__(cls)
+        magazine._id, magazine._name, magazine._category = row
+        return magazine
+
+    @classmethod
+    def exists(cls, magazine_id):
+        """ Return True if a magazine with this ID is in the database. """
+        return exec_cached(SQL_MAGAZINE_EXISTS, (magazine_id,)).fetchone() is not None
 
     @classmethod
     def get(cls, magazine_id):
         """ Retrieve a Magazine by its ID. """
-        if not isinstance(magazine_id, int) or magazine_id <= 0:
+        if not _valid_id(magazine_id):
             raise ValueError('ID must be a positive integer.')
         
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT id, name, category FROM magazines WHERE id = ?', (magazine_id,))
-            result = cursor.fetchone()
-            if result:
-                return cls(id=result[0], name=result[1], category=result[2])
-            else:
-                raise ValueError(f"Magazine with id {magazine_id} not found.")
+        magazine = cls._cache.get(magazine_id)
+        if magazine is not None:
+            return magazine
+
+        result = exec_cached(SQL_GET_MAGAZINE_BY_ID, (magazine_id,)).fetchone()
+        if result:
+            magazine = cls._cache[magazine_id] = cls._from_row(result)
+            return magazine
+        else:
+            raise ValueError(f"Magazine with id {magazine_id} not found.")
     
     def articles(self):
-        """ Retrieve all articles published in this magazine. """
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT articles.title, articles.content, articles.author_id
-                FROM articles 
-                WHERE articles.magazine_id = ?               
-            """, (self._id,))
-            return cursor.fetchall()
+        """ Yield the rows of every article published in this magazine. """
+        cursor = exec_streaming(SQL_GET_MAGAZINE_ARTICLES, (self._id,))
+        try:
+            yield from cursor
+        finally:
+            cursor.close()
 
     def contributors(self):
-        """ Retrieve all authors who have contributed to this magazine. """
-        with get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT DISTINCT authors.name
-                FROM authors
-                INNER JOIN articles ON articles.author_id = authors.id
-                WHERE articles.magazine_id = ?
-            """, (self._id,))
-            results = cursor.fetchall()
-            from models.author import Author
-            return [Author(name=result[0]) for result in results]
+        """ Yield every author who has contributed to this magazine. """
+        from models.author import Author
+        cursor = exec_streaming(SQL_GET_MAGAZINE_CONTRIBUTORS, (self._id,))
+        try:
+            for row in cursor:
+                yield Author._from_row(row)
+        finally:
+            cursor.close()
 
     def __repr__(self):
         """ String representation of the Magazine. """
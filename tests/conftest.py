@@ -0,0 +1,16 @@
+import pytest
+
+from database import connection
+from database.connection import close_db_connection
+from database.setup import create_tables
+
+@pytest.fixture(scope='session', autouse=True)
+def temporary_database(tmp_path_factory):
+    """ Point the whole suite at a fresh database so the committed magazine.db is never opened. """
+    database_name = connection.DATABASE_NAME
+    close_db_connection()
+    connection.DATABASE_NAME = str(tmp_path_factory.mktemp('db') / 'magazine.db')
+    create_tables()
+    yield
+    close_db_connection()
+    connection.DATABASE_NAME = database_name
@@ -1,4 +1,12 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import types
 import unittest
+from database import connection
+from database.connection import close_db_connection, get_db_connection
+from database.setup import create_tables
 from models.author import Author
 from models.article import Article
 from models.magazine import Magazine
@@ -16,5 +24,154 @@ class TestModels(unittest.TestCase):
         magazine = Magazine(1, "Tech Weekly")
         self.assertEqual(magazine.name, "Tech Weekly")
 
+class DatabaseTestCase(unittest.TestCase):
+    """ Runs each test against a freshly created schema in a temporary database file. """
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.database_name = connection.DATABASE_NAME
+        close_db_connection()
+        connection.DATABASE_NAME = os.path.join(self.tmpdir.name, 'magazine.db')
+        create_tables()
+        self.author = Author(name="Jane Doe")
+        self.magazine = Magazine(name="Tech Weekly", category="Technology")
+
+    def tearDown(self):
+        close_db_connection()
+        connection.DATABASE_NAME = self.database_name
+        self.tmpdir.cleanup()
+
+    def article_count(self):
+        return get_db_connection().execute('SELECT COUNT(*) FROM articles').fetchone()[0]
+
+class TestBulkCreate(DatabaseTestCase):
+    def test_returns_range_of_new_ids(self):
+        first = Article(title="First article", content="Content", author_id=self.author.id, magazine_id=self.magazine._id)
+        ids = Article.bulk_create([
+            ("Second article", "Content", self.author.id, self.magazine._id),
+            ("Third article", "Content", self.author.id, self.magazine._id),
+        ])
+        self.assertEqual(list(ids), [first.id + 1, first.id + 2])
+        self.assertEqual([Article(id=i).title for i in ids], ["Second article", "Third article"])
+
+    def test_rejects_missing_author_or_magazine(self):
+        with self.assertRaises(ValueError):
+            Article.bulk_create([("Some title", "Content", 999, self.magazine._id)])
+        with self.assertRaises(ValueError):
+            Article.bulk_create([("Some title", "Content", self.author.id, 999)])
+        self.assertEqual(self.article_count(), 0)
+
+    def test_writes_nothing_when_any_row_is_invalid(self):
+        with self.assertRaises(ValueError):
+            Article.bulk_create([
+                ("Valid title", "Content", self.author.id, self.magazine._id),
+                ("Hi", "Content", self.author.id, self.magazine._id),
+            ])
+        self.assertEqual(self.article_count(), 0)
+
+    def test_keeps_callers_open_transaction(self):
+        conn = get_db_connection()
+        conn.execute('INSERT INTO authors (name) VALUES (?)', ("Pending Author",))
+        with self.assertRaises(sqlite3.OperationalError):
+            Article.bulk_create([("Some title", "Content", self.author.id, self.magazine._id)])
+        conn.commit()
+        self.assertIsNotNone(conn.execute('SELECT id FROM authors WHERE name = ?', ("Pending Author",)).fetchone())
+
+class TestGetCache(DatabaseTestCase):
+    def test_get_memoizes(self):
+        self.assertIs(Author.get(self.author.id), Author.get(self.author.id))
+        self.assertIs(Magazine.get(self.magazine._id), Magazine.get(self.magazine._id))
+
+    def test_setters_evict_their_entry(self):
+        author = Author.get(self.author.id)
+        author.name = "Janet Doe"
+        self.assertNotIn(self.author.id, Author._cache)
+        self.assertEqual(Author.get(self.author.id).name, "Janet Doe")
+
+        magazine = Magazine.get(self.magazine._id)
+        magazine.name = "Tech Daily"
+        self.assertNotIn(self.magazine._id, Magazine._cache)
+        Magazine.get(self.magazine._id).category = "Science"
+        self.assertNotIn(self.magazine._id, Magazine._cache)
+        self.assertEqual(Magazine.get(self.magazine._id).category, "Science")
+
+    def test_id_setter_evicts_old_entry(self):
+        other = Author(name="John Roe")
+        author = Author.get(self.author.id)
+        author.id = other.id
+        self.assertEqual(Author.get(self.author.id).id, self.author.id)
+
+    def test_create_tables_clears_cache(self):
+        Author.get(self.author.id)
+        Magazine.get(self.magazine._id)
+        create_tables()
+        self.assertEqual(Author._cache, {})
+        self.assertEqual(Magazine._cache, {})
+
+class TestRelationships(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        Article(title="First article", content="Content", author_id=self.author.id, magazine_id=self.magazine._id)
+        Article(title="Second article", content="Content", author_id=self.author.id, magazine_id=self.magazine._id)
+
+    def test_results_are_generators_not_cursors(self):
+        for results in (self.author.articles(), self.author.magazines(),
+                        self.magazine.articles(), self.magazine.contributors()):
+            self.assertIsInstance(results, types.GeneratorType)
+            results.close()
+
+    def test_each_related_object_is_returned_once(self):
+        self.assertEqual([m._id for m in self.author.magazines()], [self.magazine._id])
+        self.assertEqual([a.id for a in self.magazine.contributors()], [self.author.id])
+        self.assertEqual(len(list(self.author.articles())), 2)
+        self.assertEqual(len(list(self.magazine.articles())), 2)
+
+    def test_closing_a_partial_iteration_releases_the_table(self):
+        contributors = self.magazine.contributors()
+        next(contributors)
+        contributors.close()
+        create_tables()
+
+    def test_closing_a_partial_iteration_allows_writes(self):
+        articles = self.author.articles()
+        next(articles)
+        articles.close()
+
+        def write_from_another_connection():
+            Author(name="Other Thread")
+            close_db_connection()
+        thread = threading.Thread(target=write_from_another_connection)
+        thread.start()
+        thread.join()
+
+        self.assertIsNotNone(Author(name="This Thread").id)
+
+class TestIdValidation(DatabaseTestCase):
+    def test_bool_ids_are_rejected(self):
+        for load in (Author.get, Magazine.get, Author, Magazine, Article):
+            with self.assertRaisesRegex(ValueError, 'positive integer'):
+                load(True)
+            with self.assertRaisesRegex(ValueError, 'positive integer'):
+                load(False)
+
+    def test_bool_reference_ids_are_rejected(self):
+        with self.assertRaisesRegex(ValueError, 'positive integer'):
+            Article(title="Some title", content="Content", author_id=True, magazine_id=self.magazine._id)
+
+class TestFetchData(DatabaseTestCase):
+    def test_multi_row_query_does_not_hold_the_table(self):
+        Author(name="John Roe")
+        self.assertIsNotNone(Author.fetch_data('SELECT id FROM authors', ()))
+        self.assertIsNotNone(Article.fetch_data('SELECT id FROM authors', ()))
+        create_tables()
+
+class TestCreateTables(DatabaseTestCase):
+    def test_refuses_to_run_inside_open_transaction(self):
+        conn = get_db_connection()
+        conn.execute('INSERT INTO authors (name) VALUES (?)', ("Pending Author",))
+        with self.assertRaises(sqlite3.OperationalError):
+            create_tables()
+        conn.commit()
+        self.assertIsNotNone(conn.execute('SELECT id FROM authors WHERE name = ?', ("Pending Author",)).fetchone())
+
 if __name__ == "__main__":
     unittest.main()